@@ -51,12 +51,21 @@ class DataModule(LightningDataModule):
             gpu_size=1,
             num_workers: int = 4,
             pin_memory=True,
+            persistent_workers=True,
+            prefetch_factor: int = 4,
     ):
         super().__init__()
         self.datasets = data
         self.gpu_size = gpu_size
         self.num_workers = num_workers
         self.pin_memory = pin_memory
+        # Persistent workers keep the forked dataset (including task wrappers with an expensive
+        # task_list) alive across epochs instead of rebuilding it on every epoch start. This only
+        # pays off when the Trainer is not reloading dataloaders every epoch
+        # (reload_dataloaders_every_n_epochs, reload_freq in lightning_fit), which re-forks the
+        # workers regardless.
+        self.persistent_workers = persistent_workers
+        self.prefetch_factor = prefetch_factor
 
     def create_dataloader(
             self,
@@ -79,6 +88,13 @@ class DataModule(LightningDataModule):
                 sampler = RandomSampler(data, num_samples=sample_size, replacement=True)
                 loader_shuffle = False
 
+        # Both options are rejected by the DataLoader when num_workers is 0 (even explicit
+        # defaults raise there), so they are only passed when worker processes exist.
+        worker_kwargs = {}
+        if num_workers > 0:
+            worker_kwargs["persistent_workers"] = self.persistent_workers
+            worker_kwargs["prefetch_factor"] = self.prefetch_factor
+
         if isinstance(data, DatasetWithCollate):
             return DataLoader(
                 data,
@@ -89,6 +105,7 @@ class DataModule(LightningDataModule):
                 collate_fn=data.get_collate_fn(),
                 drop_last=drop_last,
                 pin_memory=self.pin_memory,
+                **worker_kwargs,
             )
         if isinstance(data, PygDataset):
             return PygDataloader(
@@ -100,6 +117,7 @@ class DataModule(LightningDataModule):
                 collate_fn=data.get_collate_fn(),
                 drop_last=drop_last,
                 pin_memory=self.pin_memory,
+                **worker_kwargs,
             )
 
     def train_dataloader(self):
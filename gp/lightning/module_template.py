@@ -91,29 +91,41 @@ class BaseTemplate(LightningModule):
     def compute_results(self, batch, batch_idx, step_name, log_loss=True, *args):
         score = self(batch, *args)
         loss = self.eval_kit.compute_loss(score, batch)
-        self.log(osp.join(self.name, step_name, "loss"), loss, on_step=True, on_epoch=False, prog_bar=log_loss,
-                 batch_size=batch.batch_size if hasattr(batch, "batch_size") else len(batch), sync_dist=True, )
-        with torch.no_grad():
-            if self.eval_kit.has_eval_state(step_name):
-                self.eval_kit.eval_step(score, batch, step_name)
+        loss_name = osp.join(self.name, step_name, "loss")
+        batch_size = batch.batch_size if hasattr(batch, "batch_size") else len(batch)
+        # The per-step value is rank-local progress reporting only; syncing it would add one
+        # all-reduce per step. The cross-rank reduction happens once on the epoch mean below.
+        self.log(loss_name, loss, on_step=True, on_epoch=False, prog_bar=log_loss, batch_size=batch_size,
+                 sync_dist=False, )
+        self.log(loss_name + "_epoch", loss, on_step=False, on_epoch=True, batch_size=batch_size, sync_dist=True, )
+        if self.eval_kit.has_eval_state(step_name):
+            # Detach once instead of flipping autograd state per step: metrics never need the graph,
+            # and torchmetrics runs its update with grad disabled anyway. Only exact list/tuple
+            # outputs are rebuilt element-wise; namedtuple model outputs (e.g. GNNLMOutput) cannot be
+            # reconstructed from a single iterable, so they pass through like any other output object.
+            if isinstance(score, torch.Tensor):
+                eval_score = score.detach()
+            elif type(score) in (list, tuple):
+                eval_score = type(score)(s.detach() if isinstance(s, torch.Tensor) else s for s in score)
+            else:
+                eval_score = score
+            self.eval_kit.eval_step(eval_score, batch, step_name)
         return score, loss
 
     def epoch_post_process(self, epoch_name):
         if self.eval_kit.has_eval_state(epoch_name):
             metric = self.eval_kit.eval_epoch(epoch_name)
-            self.log(self.eval_kit.get_metric_name(epoch_name), metric, prog_bar=True, sync_dist=True)
+            # eval_epoch goes through torchmetrics compute(), which already all-reduces the metric
+            # state across ranks; sync_dist=True here would issue a second collective per metric.
+            self.log(self.eval_kit.get_metric_name(epoch_name), metric, prog_bar=True, sync_dist=False)
             self.eval_kit.eval_reset(epoch_name)
             return metric
 
     def training_step(self, batch, batch_idx, dataloader_idx=0):
-        try:
-            score, loss = self.compute_results(batch, batch_idx, self.exp_config.train_state_name[dataloader_idx])
-        except RuntimeError as e:
-            if "out of memory" in str(e):
-                print("Ignoring OOM batch")
-                loss = torch.tensor([0])
-            else:
-                raise e
+        # No OOM catch here: returning a detached dummy loss desynchronizes DDP's bucketed reducer
+        # and leaves other ranks waiting at the next all-reduce. Subclasses that can rebuild the
+        # batch (see GraphTextPredLightning) may recover; otherwise let the error surface.
+        score, loss = self.compute_results(batch, batch_idx, self.exp_config.train_state_name[dataloader_idx])
         return loss
 
     def on_train_epoch_end(self):
@@ -124,11 +136,15 @@ class BaseTemplate(LightningModule):
         self.compute_results(batch, batch_idx, self.exp_config.val_state_name[dataloader_idx], log_loss=False, )
 
     def on_validation_epoch_end(self):
+        # Queue the device-to-host copy of every val metric first and synchronize once at the end,
+        # instead of blocking on a separate .cpu() transfer per validation dataset.
         cur_metric = []
         for name in self.exp_config.val_state_name:
             metric = self.epoch_post_process(name)
             if metric is not None:
-                cur_metric.append(metric.cpu())
+                cur_metric.append(metric.to("cpu", non_blocking=True))
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
         if self.exp_config.dataset_callback is not None:
             self.exp_config.dataset_callback(cur_metric)
 
@@ -1,5 +1,12 @@
 import argparse
 import os
+
+# Configure the caching allocator before any CUDA context is created. Variable-sized graph batches
+# fragment the allocator badly; capping the split size keeps long runs from fragmenting into OOM.
+# Only max_split_size_mb is set: the pinned torch errors out on unknown options such as
+# expandable_segments, which needs torch >= 2.1.
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "max_split_size_mb:128")
+
 from collections import OrderedDict
 from datetime import timedelta
 
@@ -1,5 +1,19 @@
 from TAGLAS import get_dataset
 
+# Dataset objects memoized across wrapper instances. Train/val/test wrappers over the same dataset
+# differ only in task-level arguments (split, sampling), so the expensive disk load and index build
+# of the underlying dataset can be shared.
+_dataset_cache = {}
+
+
 def get_pretrain_dataset(name, root, **kwargs):
     # Can be expanded in the future for advanced dataset loading.
-    return get_dataset(name, root, **kwargs)
+    try:
+        key = (name, root, tuple(sorted(kwargs.items())))
+        hash(key)
+    except TypeError:
+        # Unhashable kwargs (e.g. callables): fall back to an uncached load.
+        return get_dataset(name, root, **kwargs)
+    if key not in _dataset_cache:
+        _dataset_cache[key] = get_dataset(name, root, **kwargs)
+    return _dataset_cache[key]
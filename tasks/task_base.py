@@ -6,19 +6,38 @@ from typing import (
 )
 from torch.utils.data import Dataset
 import torch
+import re
 import string
+from functools import lru_cache
 import numpy as np
 
+NODE_INDEX_PATTERN = re.compile(r"\[NODE_INDEX (\d+)\]")
+
 def generate_random_node_order(num_nodes: int):
     return torch.randperm(num_nodes)
 
+@lru_cache(maxsize=1)
 def generate_alphabet_id():
     # support graph with less than 26 * 26 nodes.
+    # Memoized: the id table is identical for every sample and was rebuilt per __getitem__ call.
     alphabet = list(string.ascii_uppercase)
     alphabet_ext = [a + b for a in alphabet for b in alphabet]
     alphabet += alphabet_ext
     return np.array(["[NODEID." + s + "]" for s in alphabet], dtype=object)
 
+def replace_node_index_placeholder(texts, node_ids):
+    r"""Replace all [NODE_INDEX i] placeholders in texts with the corresponding node id in one regex
+    pass per text, instead of one str.replace scan per node per text."""
+    num_nodes = len(node_ids)
+
+    def sub_node_id(match):
+        node_index = int(match.group(1))
+        return node_ids[node_index] if node_index < num_nodes else match.group(0)
+
+    for i in range(len(texts)):
+        if "[NODE_INDEX" in texts[i]:
+            texts[i] = NODE_INDEX_PATTERN.sub(sub_node_id, texts[i])
+
 def generate_node_id(num_nodes):
     char_ids = generate_alphabet_id()
     node_order = generate_random_node_order(num_nodes)
@@ -98,13 +117,9 @@ def build_GOFA_task_graph(data, add_prompt_graph=True, is_pretrain=False, single
         data.x[i] = f"This is node {node_ids[i]}." + data.x[i]
 
     # Replace placeholder in question and answer with node id
-    for i in range(num_nodes):
-        for q in range(len(data.question)):
-            data.question[q] = data.question[q].replace(f"[NODE_INDEX {i}]", node_ids[i])
-        for a in range(len(data.answer)):
-            data.answer[a] = data.answer[a].replace(f"[NODE_INDEX {i}]", node_ids[i])
-        for l in range(len(data.label)):
-            data.label[l] = data.label[l].replace(f"[NODE_INDEX {i}]", node_ids[i])
+    replace_node_index_placeholder(data.question, node_ids)
+    replace_node_index_placeholder(data.answer, node_ids)
+    replace_node_index_placeholder(data.label, node_ids)
 
     # add prompt graph
     prompt_edge_text = np.array(['This edge connects the nodes in graph to a prompt node.',
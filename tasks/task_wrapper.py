@@ -13,6 +13,8 @@ from TAGLAS.tasks.base import QATask
 from TAGLAS.data import TAGData
 import numpy as np
 import torch
+import os
+from concurrent.futures import ThreadPoolExecutor
 from .build_prompt import build_finetune_task_prompt
 from .task_base import build_GOFA_task_graph
 from functools import partial
@@ -79,27 +81,43 @@ class GOFATaskWrapper(DatasetWithCollate, ABC):
 
 
         self.task_sizes = np.array([len(t) for t in self.task_list])
-        self.ind2task = np.arange(self.num_tasks).repeat(self.task_sizes)
-        self.sample_ind = np.concatenate([np.arange(size) for size in self.task_sizes], axis=-1).astype(int)
         self.size_seg = np.cumsum(self.task_sizes)
         self.data_start_index = np.r_[0, self.size_seg[:-1]]
+        self.total_size = int(self.task_sizes.sum())
 
+        # collate runs for every batch in every DataLoader worker: bind the underlying collate once
+        # instead of resolving the task_list[0].collate attribute chain per batch. Mixed label dtypes
+        # can only arise across different tasks, so the dtype scan is skipped for single-task wrappers.
+        self._collate_impl = self.task_list[0].collate
+        self._check_y_dtype = self.num_tasks > 1
 
-    def __parse_input_args__(self, values: Any, num_task: int, is_list=False, default_none=False) -> list:
-        if default_none:
-            if values is None:
-                return [None for _ in range(num_task)]
+
+    def __parse_input_args__(self, values: Any, num_task: int, is_list=False, default_none=False) -> tuple:
+        r"""Broadcast a per-task argument to a tuple of length num_task. Tuples are built with C-level
+        repetition instead of a Python loop and are immutable, so a shared argument cannot be mutated
+        in place for a single task by accident."""
+        if values is None:
+            return (None,) * num_task
 
         if is_list:
             if isinstance(values[0], list):
                 assert len(values) == num_task
-                return values
+                return tuple(values)
         else:
             if isinstance(values, list):
                 assert len(values) == num_task
-                return values
+                return tuple(values)
+
+        return (values,) * num_task
 
-        return [values for _ in range(num_task)]
+    def __build_task_list__(self, build_task: Callable):
+        r"""Materialize all tasks, overlapping construction across tasks with a thread pool.
+        Task generation is dominated by dataset file I/O, which releases the GIL, so wrapper
+        startup approaches the cost of the slowest single task instead of the sum of all tasks."""
+        if self.num_tasks == 1:
+            return [build_task(0)]
+        with ThreadPoolExecutor(max_workers=min(self.num_tasks, os.cpu_count() or 1)) as pool:
+            return list(pool.map(build_task, range(self.num_tasks)))
 
     @abstractmethod
     def __get_task_list__(self):
@@ -107,29 +125,38 @@ class GOFATaskWrapper(DatasetWithCollate, ABC):
 
 
     def __getitem__(self, index):
-        task_ind = self.ind2task[index]
+        task_ind = int(np.searchsorted(self.size_seg, index, side="right"))
         task = self.task_list[task_ind]
-        data = task[self.sample_ind[index]]
+        data = task[int(index - self.data_start_index[task_ind])]
         data.task_idx = task_ind
         return data
 
     def __len__(self):
-        return np.sum(self.task_sizes)
+        return self.total_size
 
     def collate(self, batch: list[TAGData]):
-        float_flag = False
-        int_flag = False
-        for data in batch:
-            if isinstance(data.y, torch.FloatTensor):
-                float_flag = True
-            elif isinstance(data.y, torch.IntTensor) or isinstance(data.y, torch.LongTensor):
-                int_flag = True
-
-        if float_flag and int_flag:
+        if self._check_y_dtype:
+            # Homogenize label dtypes across tasks in a single pass. dtype checks instead of isinstance:
+            # isinstance(y, torch.FloatTensor) only matches CPU float32 and silently skips CUDA/half tensors.
+            float_flag = False
+            int_flag = False
             for data in batch:
-                data.y = data.y.float()
-
-        return self.task_list[0].collate(batch)
+                if isinstance(data.y, Tensor):
+                    if data.y.is_floating_point():
+                        float_flag = True
+                    else:
+                        int_flag = True
+
+            if float_flag and int_flag:
+                for data in batch:
+                    if isinstance(data.y, Tensor):
+                        data.y = data.y.float()
+
+        # Returned as a TAGData so the DataLoader's pin-memory thread and Lightning's device transfer
+        # use the batch's own per-tensor pin/to path. Coalescing the index tensors into one flat pinned
+        # buffer would need a matching custom transfer hook to pay off; without it PyG still pins and
+        # copies attribute by attribute, so the extra flattening copy would be pure overhead.
+        return self._collate_impl(batch)
 
     def get_collate_fn(self):
         return self.collate
@@ -198,20 +225,16 @@ class GOFAPretrainTaskWrapper(GOFATaskWrapper):
             num_workers: int = 0,
             post_funcs: list[Callable] = None,
             pretrain_tasks: list = ["CS"],
+            graph_build_func: Optional[Callable] = None,
             **kwargs
     ):
         dataset = get_pretrain_dataset(name, root, num_workers=num_workers, **kwargs)
         if post_funcs is None:
             post_funcs = []
-        add_prompt_graph = False
-        if "add_prompt_graph" in kwargs:
-            add_prompt_graph = kwargs["add_prompt_graph"]
-        single_direction = False
-        if "single_direction" in kwargs:
-            single_direction = kwargs["single_direction"]
+        if graph_build_func is None:
+            graph_build_func = self.__build_graph_func__(**kwargs)
 
-        post_funcs = post_funcs + [partial(build_GOFA_task_graph, is_pretrain=True, add_prompt_graph=add_prompt_graph,
-                                           single_direction=single_direction)]
+        post_funcs = post_funcs + [graph_build_func]
 
         if name in ["ultrachat200k", "wiki_graph"]:
             task_class = GOFAGraphPretrainTask
@@ -227,10 +250,19 @@ class GOFAPretrainTaskWrapper(GOFATaskWrapper):
                         sample_size=sample_size, sample_mode=sample_mode, num_workers=num_workers, hop=hop,
                         max_nodes_per_hop=max_nodes_per_hop, pretrain_tasks=pretrain_tasks, **kwargs)
 
+    def __build_graph_func__(self, **kwargs):
+        r"""Build the shared GOFA task graph construction function. The partial only depends on
+        wrapper-level kwargs, so it is created once and reused by every task and every sample."""
+        add_prompt_graph = kwargs.get("add_prompt_graph", False)
+        single_direction = kwargs.get("single_direction", False)
+        return partial(build_GOFA_task_graph, is_pretrain=True, add_prompt_graph=add_prompt_graph,
+                       single_direction=single_direction)
+
     def __get_task_list__(self):
-        task_list = []
-        for i in range(self.num_tasks):
-            task_list.append(self.__get_pretrain_task__(
+        graph_build_func = self.__build_graph_func__(**self.kwargs)
+
+        def build_task(i):
+            return self.__get_pretrain_task__(
                 name=self.task_names[i],
                 root=self.roots[i],
                 split=self.splits[i],
@@ -244,9 +276,10 @@ class GOFAPretrainTaskWrapper(GOFATaskWrapper):
                 max_nodes_per_hop=self.max_nodes_per_hops[i],
                 num_workers=self.num_workers[i],
                 pretrain_tasks=self.pretrain_tasks[i],
+                graph_build_func=graph_build_func,
                 **self.kwargs,
-                ))
-        return task_list
+                )
+        return self.__build_task_list__(build_task)
 
 
 class GOFAFineTuneTaskWrapper(GOFATaskWrapper):
@@ -303,15 +336,14 @@ class GOFAFineTuneTaskWrapper(GOFATaskWrapper):
                          sample_size, sample_mode, hop, max_nodes_per_hop, num_workers, **kwargs)
 
     def __get_task_list__(self):
-        task_list = []
-        for i in range(self.num_tasks):
+        def build_task(i):
             prompt_func = partial(build_finetune_task_prompt, task_name=self.task_names[i], way=self.ways[i],
                                   selection=self.selections[i], instruction=self.instructions[i])
             additional_post_funcs = self.post_funcs[i]
             if additional_post_funcs is None:
                 additional_post_funcs = []
             post_funcs = additional_post_funcs + [prompt_func, build_GOFA_task_graph]
-            task_list.append(get_task(
+            return get_task(
                 name=self.task_names[i],
                 task_type="QA",
                 root=self.roots[i],
@@ -327,9 +359,9 @@ class GOFAFineTuneTaskWrapper(GOFATaskWrapper):
                 max_nodes_per_hop=self.max_nodes_per_hops[i],
                 num_workers=self.num_workers[i],
                 **self.kwargs,
-                ))
+                )
 
-        return task_list
+        return self.__build_task_list__(build_task)
 
 
 